@@ -1,6 +1,7 @@
 import re
 import logging
 import spacy
+from resources import track_engine, ENGINE_SPACY
 
 logger = logging.getLogger(__name__)
 
@@ -8,10 +9,14 @@ ANSWER_TYPE_YES_NO = 'YES_NO'
 ANSWER_TYPE_ENTITY = 'ENTITY'
 
 class AnswerExtractor:
-    def __init__(self):
+    def __init__(self, resources=None):
         """
         AnswerExtractor using spaCy.
+
+        Parameters:
+            resources (ResourceConfig): Resource configuration used to track spaCy utilization.
         """
+        self.resources = resources
         try:
             self.nlp = spacy.load("en_core_web_md")
             logger.info("Loaded spaCy model 'en_core_web_md' for AnswerExtractor.")
@@ -32,11 +37,11 @@ class AnswerExtractor:
         """
         # Preprocess LLM output: Replace newlines with spaces
         processed_output = llm_output.replace('\n', ' ').strip()
-        logger.info(f"Processed LLM Output: {processed_output}")
+        logger.debug("Processed LLM Output: %s", processed_output)
 
         # Determine if the question expects a yes/no answer
         yes_no_question = self.is_yes_no_question(question_text)
-        logger.info(f"Is yes/no question: {yes_no_question}")
+        logger.debug("Is yes/no question: %s", yes_no_question)
 
         # Initialize variables to store potential answers
         extracted_answer = None
@@ -48,7 +53,7 @@ class AnswerExtractor:
             if match:
                 extracted_answer = match.group(1)
                 answer_type = ANSWER_TYPE_YES_NO
-                logger.info(f"Extracted yes/no answer: {extracted_answer}")
+                logger.info("Extracted yes/no answer: %s", extracted_answer)
                 return extracted_answer, answer_type
             else:
                 logger.info("Yes/No question detected but no explicit yes/no answer found.")
@@ -58,16 +63,17 @@ class AnswerExtractor:
         if match:
             extracted_answer = match.group(0)
             answer_type = ANSWER_TYPE_ENTITY
-            logger.info(f"Extracted entity answer (URL): {extracted_answer}")
+            logger.info("Extracted entity answer (URL): %s", extracted_answer)
             return extracted_answer, answer_type
 
         # If no URL, use spaCy to extract the first relevant entity
-        doc = self.nlp(processed_output)
+        with track_engine(self.resources, ENGINE_SPACY):
+            doc = self.nlp(processed_output)
         for ent in doc.ents:
             if ent.label_ in ['GPE', 'LOC', 'ORG', 'PERSON']:
                 extracted_answer = ent.text
                 answer_type = ANSWER_TYPE_ENTITY
-                logger.info(f"Extracted entity answer via spaCy: {extracted_answer}")
+                logger.info("Extracted entity answer via spaCy: %s", extracted_answer)
                 return extracted_answer, answer_type
 
         # Fallback: Attempt to extract yes/no answer even if it's not a yes/no question
@@ -76,7 +82,7 @@ class AnswerExtractor:
         if match:
             extracted_answer = match.group(1)
             answer_type = ANSWER_TYPE_YES_NO
-            logger.info(f"Fallback extracted yes/no answer: {extracted_answer}")
+            logger.info("Fallback extracted yes/no answer: %s", extracted_answer)
             return extracted_answer, answer_type
 
         # If all extraction methods fail, default to 'no' with YES_NO type
@@ -107,7 +113,7 @@ class AnswerExtractor:
         pattern = r'^\s*(?:Question:\s*)?(' + '|'.join(yes_no_verbs) + r')\b'
         match = re.match(pattern, question_text, re.IGNORECASE)
         if match:
-            logger.debug(f"Question starts with a yes/no verb: '{match.group(1)}'")
+            logger.debug("Question starts with a yes/no verb: '%s'", match.group(1))
             return True
         else:
             logger.debug("Question does not start with a yes/no verb.")
@@ -4,6 +4,7 @@ import math
 import logging
 from SPARQLWrapper import SPARQLWrapper, JSON
 import spacy
+from resources import track_engine, ENGINE_SPACY
 
 # Obtain a logger for this module
 logger = logging.getLogger(__name__)
@@ -30,10 +31,14 @@ NER_TO_DBPEDIA_TYPE = {
 }
 
 class EntityExtractor:
-    def __init__(self):
+    def __init__(self, resources=None):
         """
         Initializes the EntityExtractor with spaCy and SPARQL settings.
+
+        Parameters:
+            resources (ResourceConfig): Resource configuration used to track spaCy utilization.
         """
+        self.resources = resources
         try:
             self.nlp = spacy.load("en_core_web_md")
             logger.info("Loaded spaCy model 'en_core_web_md'.")
@@ -67,14 +72,15 @@ class EntityExtractor:
         Returns:
             list: A list of tuples containing entity text and their DBpedia URIs.
         """
-        doc = self.nlp(text)
+        with track_engine(self.resources, ENGINE_SPACY):
+            doc = self.nlp(text)
         entities = [(ent.text, ent.label_) for ent in doc.ents]
-        logger.info(f"Extracted Entities: {entities}")
+        logger.debug("Extracted Entities: %s", entities)
         linked_entities = []
 
         for e in entities:
             entity_text, entity_label = e
-            logger.info(f'Processing entity: "{entity_text}" with label "{entity_label}"')
+            logger.debug('Processing entity: "%s" with label "%s"', entity_text, entity_label)
             try:
                 # Mapping the spaCy label to DBpedia types
                 dbpedia_types = NER_TO_DBPEDIA_TYPE.get(entity_label)
@@ -118,40 +124,43 @@ class EntityExtractor:
                     candidate_uri = result["entity"]["value"]
                     candidate_abstract = result.get("abstract", {}).get("value", "")
                     candidates.append((candidate_uri, candidate_abstract))
-                logger.info(f"Candidates for '{entity_text}': {[uri for uri, _ in candidates]}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Candidates for '%s': %s", entity_text, [uri for uri, _ in candidates])
 
                 if not candidates:
-                    logger.info(f"No candidates found for '{entity_text}'.")
+                    logger.debug("No candidates found for '%s'.", entity_text)
                     continue
 
                 # Using the context to select the best candidate
                 best_candidate = None
                 best_similarity = -1
-                context_doc = self.nlp(context)
+                with track_engine(self.resources, ENGINE_SPACY):
+                    context_doc = self.nlp(context)
                 for candidate_uri, candidate_abstract in candidates:
                     if candidate_abstract:
-                        candidate_doc = self.nlp(candidate_abstract)
+                        with track_engine(self.resources, ENGINE_SPACY):
+                            candidate_doc = self.nlp(candidate_abstract)
                         if context_doc.vector_norm == 0 or candidate_doc.vector_norm == 0:
-                            logger.info(f"Zero vector encountered for context or candidate '{candidate_uri}'. Skipping.")
+                            logger.debug("Zero vector encountered for context or candidate '%s'. Skipping.", candidate_uri)
                             continue
                         similarity = context_doc.similarity(candidate_doc)
-                        logger.info(f"Cosine Similarity between context and '{candidate_uri}': {similarity}")
+                        logger.debug("Cosine Similarity between context and '%s': %s", candidate_uri, similarity)
                         if math.isnan(similarity):
-                            logger.info(f"Cosine Similarity is NaN for candidate '{candidate_uri}'. Skipping.")
+                            logger.debug("Cosine Similarity is NaN for candidate '%s'. Skipping.", candidate_uri)
                             continue
                         if similarity > best_similarity:
                             best_similarity = similarity
                             best_candidate = candidate_uri
                     else:
-                        logger.info(f"No abstract available for '{candidate_uri}'. Skipping similarity calculation.")
+                        logger.debug("No abstract available for '%s'. Skipping similarity calculation.", candidate_uri)
 
                 if best_candidate:
-                    logger.info(f'Using best candidate "{best_candidate}".')
+                    logger.info('Using best candidate "%s".', best_candidate)
                     linked_entities.append((entity_text, best_candidate))
                 else:
-                    logger.info(f"Could not find a suitable candidate for '{entity_text}'.")
+                    logger.info("Could not find a suitable candidate for '%s'.", entity_text)
 
             except Exception as ex:
-                logger.error(f'An unexpected error occurred while processing "{entity_text}": {ex}')
+                logger.error('An unexpected error occurred while processing "%s": %s', entity_text, ex)
 
         return linked_entities
\ No newline at end of file
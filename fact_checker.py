@@ -1,19 +1,26 @@
 import requests
 from transformers import pipeline
 import logging
+from resources import track_engine, ENGINE_TORCH
 
 logger = logging.getLogger(__name__)
 
 class FactChecker:
-    def __init__(self):
+    def __init__(self, resources=None):
         """
         Initializes the FactChecker with the triplet extractor pipeline.
+
+        Parameters:
+            resources (ResourceConfig): Thread budget for torch; torch defaults when None.
         """
+        self.resources = resources
+        if resources:
+            resources.configure_torch()
         try:
             self.triplet_extractor = pipeline('text2text-generation', model='Babelscape/rebel-large', tokenizer='Babelscape/rebel-large')
             logger.info("Initialized triplet extractor pipeline.")
         except Exception as e:
-            logger.error(f"Failed to initialize triplet extractor: {e}")
+            logger.error("Failed to initialize triplet extractor: %s", e)
             raise
 
     def extract_triplets(self, text):
@@ -26,7 +33,7 @@ class FactChecker:
         Returns:
             list: A list of triplet dictionaries with 'head', 'type', 'tail'.
         """
-        logger.info(f"Extracting triplets from text: {text}")
+        logger.debug("Extracting triplets from text: %s", text)
         triplets = []
         relation, subject, object_ = '', '', ''
         text = text.strip()
@@ -56,7 +63,7 @@ class FactChecker:
                     relation += ' ' + token
         if subject != '' and relation != '' and object_ != '':
             triplets.append({'head': subject.strip(), 'type': relation.strip(), 'tail': object_.strip()})
-        logger.info(f"Extracted Triplets: {triplets}")
+        logger.debug("Extracted Triplets: %s", triplets)
         return triplets
 
     def get_entity_id(self, entity):
@@ -82,10 +89,10 @@ class FactChecker:
             data = requests.get(url, params=params)
             data = data.json()
             entity_id = data['search'][0]['id'] if 'search' in data and data['search'] else None
-            logger.info(f"Fetched entity ID for '{entity}': {entity_id}")
+            logger.debug("Fetched entity ID for '%s': %s", entity, entity_id)
             return entity_id
         except Exception as e:
-            logger.error(f"Fetching entity ID failed for '{entity}': {e}")
+            logger.error("Fetching entity ID failed for '%s': %s", entity, e)
             return None
 
     def get_wikidata_relations(self, subj, obj):
@@ -100,7 +107,7 @@ class FactChecker:
             set: A set of relation labels.
         """
 
-        logger.info(f"Getting wikidata relations for subject: '{subj}': object: {obj}")
+        logger.debug("Getting wikidata relations for subject: '%s': object: %s", subj, obj)
         if not subj or not obj:
             return set()
 
@@ -127,18 +134,18 @@ class FactChecker:
             r = requests.get(url, params={'format': 'json', 'query': query})
             data = r.json()
             if not data['results']['bindings']:
-                logger.info(f"No relations found between '{subj}' and '{obj}'.")
+                logger.debug("No relations found between '%s' and '%s'.", subj, obj)
                 return set()
 
             relations = set()
             for binding in data['results']['bindings']:
                 relations.add(binding['wdLabel']['value'])
 
-            logger.info(f"Retrieved relations between '{subj}' and '{obj}': {relations}")
+            logger.debug("Retrieved relations between '%s' and '%s': %s", subj, obj, relations)
             return relations
 
         except Exception as e:
-            logger.error(f"SPARQL query to Wikidata failed: {e}")
+            logger.error("SPARQL query to Wikidata failed: %s", e)
             return set()
 
     def validate_answer(self, prompt, answer_tuple):
@@ -156,18 +163,19 @@ class FactChecker:
         entity_name = answer_tuple[1]
 
         # Extract triplets from the raw output
-        logger.info(f"Extracting triplets for prompt: {prompt} and answer: {answer_tuple}")
+        logger.debug("Extracting triplets for prompt: %s and answer: %s", prompt, answer_tuple)
         try:
             if not entity_name:
                 entity_name = ""
-            generated = self.triplet_extractor("".join((prompt, entity_name)), return_tensors=True, return_text=False)
+            with track_engine(self.resources, ENGINE_TORCH):
+                generated = self.triplet_extractor("".join((prompt, entity_name)), return_tensors=True, return_text=False)
             extracted_text = self.triplet_extractor.tokenizer.decode(generated[0]["generated_token_ids"])
             extracted_triplets = self.extract_triplets(extracted_text)
         except Exception as e:
-            logger.error(f"Triplet extraction failed: {e}")
+            logger.error("Triplet extraction failed: %s", e)
             return 'incorrect'
 
-        logger.info(f"Extracted Triplets: {extracted_triplets}")
+        logger.debug("Extracted Triplets: %s", extracted_triplets)
 
         # If yes/no answer
         if answer.lower() in ("yes", "no"):
@@ -177,7 +185,7 @@ class FactChecker:
                 # Get relations from Wikidata
                 relations.update(self.get_wikidata_relations(triplet['head'], triplet['tail']))
 
-                logger.debug(f"Relations List: {relations}")
+                logger.debug("Relations List: %s", relations)
 
                 # There is a relation, the answer was YES => correct
                 if triplet['type'] in relations and answer.lower() == 'yes':
@@ -203,7 +211,7 @@ class FactChecker:
                 relations.update(self.get_wikidata_relations(triplet['head'], entity_name))
                 relations.update(self.get_wikidata_relations(entity_name, triplet['tail']))
 
-                logger.info(f"Relations List: {relations}")
+                logger.debug("Relations List: %s", relations)
 
                 # There is a relation => correct
                 if triplet['type'] in relations:
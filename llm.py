@@ -1,24 +1,180 @@
 # llm_interface.py
+import time
 import logging
+import numpy as np
 from llama_cpp import Llama
+from llama_cpp.llama_speculative import LlamaDraftModel, LlamaPromptLookupDecoding
+from resources import track_engine, ENGINE_LLAMA
 
 logger = logging.getLogger(__name__)
 
+SPECULATIVE_PROMPT_LOOKUP = 'prompt_lookup'
+SPECULATIVE_DRAFT_MODEL = 'draft_model'
+
+class GGUFDraftModel(LlamaDraftModel):
+    def __init__(self, model_path, num_pred_tokens=8, llama_kwargs=None):
+        """
+        Draft model that proposes tokens by greedy decoding with a small GGUF model.
+        The draft model must share the tokenizer/vocabulary of the main model
+        (e.g. TinyLlama for llama-2).
+
+        Parameters:
+            model_path (str): Path to the draft GGUF model file.
+            num_pred_tokens (int): Number of tokens to propose per verification pass.
+            llama_kwargs (dict): Extra threading/memory options for llama_cpp.Llama.
+        """
+        self.llm = Llama(model_path=model_path, verbose=False, **(llama_kwargs or {}))
+        self.num_pred_tokens = num_pred_tokens
+        logger.info("Draft model loaded from %s", model_path)
+
+    def __call__(self, input_ids, /, **kwargs):
+        draft_tokens = []
+        # Stay within the draft context; the last drafted token is never evaluated
+        num_pred_tokens = min(self.num_pred_tokens, self.llm.n_ctx() - len(input_ids))
+        if num_pred_tokens <= 0:
+            return np.array(draft_tokens, dtype=np.intc)
+        # generate() reuses the KV cache for the longest common prefix with the previous call
+        for token in self.llm.generate(input_ids.tolist(), temp=0.0, top_k=1):
+            if token == self.llm.token_eos():
+                break
+            draft_tokens.append(token)
+            if len(draft_tokens) >= num_pred_tokens:
+                break
+        return np.array(draft_tokens, dtype=np.intc)
+
+class CountingDraftModel(LlamaDraftModel):
+    def __init__(self, draft_model):
+        """
+        Wraps a draft model and counts verification passes, proposed and accepted tokens.
+
+        A draft is verified by the main model before the next call, whose input_ids
+        then contain the accepted prefix of that draft, so accepted tokens are counted
+        by comparing each draft with the input_ids of the following call.
+
+        Parameters:
+            draft_model (LlamaDraftModel): The draft model to wrap.
+        """
+        self.draft_model = draft_model
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.proposed_tokens = 0
+        self.accepted_tokens = 0
+        # (input length, draft tokens) of the last draft, not yet verified by a following call
+        self.pending_draft = None
+
+    def _count_accepted(self, input_ids):
+        n_input, draft_tokens = self.pending_draft
+        verified = input_ids[n_input:n_input + len(draft_tokens)]
+        for draft_token, token in zip(draft_tokens, verified):
+            if draft_token != token:
+                break
+            self.accepted_tokens += 1
+        self.pending_draft = None
+
+    def __call__(self, input_ids, /, **kwargs):
+        if self.pending_draft is not None:
+            self._count_accepted(input_ids)
+        draft_tokens = self.draft_model(input_ids, **kwargs)
+        self.calls += 1
+        self.proposed_tokens += len(draft_tokens)
+        self.pending_draft = (len(input_ids), np.array(draft_tokens, copy=True))
+        return draft_tokens
+
 class LLMInterface:
-    def __init__(self, model_path):
+    def __init__(self, model_path, speculative_mode=None, draft_model_path=None, num_pred_tokens=8, resources=None):
         """
         Initializes the LLM interface with the specified model.
 
         Parameters:
             model_path (str): Path to the LLM model file.
+            speculative_mode (str): None, 'prompt_lookup' or 'draft_model' to enable speculative decoding.
+            draft_model_path (str): Path to the draft GGUF model, required for 'draft_model' mode.
+            num_pred_tokens (int): Number of draft tokens proposed per verification pass.
+            resources (ResourceConfig): Thread and memory budget; llama.cpp defaults when None.
         """
-        self.llm = Llama(model_path=model_path, verbose=False)
-        logging.info(f"LLM model loaded from {model_path}")
+        llama_kwargs = resources.llama_kwargs() if resources else {}
+        self.draft_model = None
+        if speculative_mode == SPECULATIVE_PROMPT_LOOKUP:
+            self.draft_model = CountingDraftModel(LlamaPromptLookupDecoding(num_pred_tokens=num_pred_tokens))
+        elif speculative_mode == SPECULATIVE_DRAFT_MODEL:
+            if not draft_model_path:
+                raise ValueError("draft_model_path is required for speculative mode 'draft_model'.")
+            self.draft_model = CountingDraftModel(GGUFDraftModel(draft_model_path, num_pred_tokens=num_pred_tokens,
+                                                               llama_kwargs=llama_kwargs))
+        elif speculative_mode is not None:
+            raise ValueError(f"Unknown speculative mode: {speculative_mode}")
+
+        self.llm = Llama(model_path=model_path, draft_model=self.draft_model, verbose=False, **llama_kwargs)
+        self.resources = resources
+        self.speculative_stats = {'completion_tokens': 0, 'proposed_tokens': 0, 'accepted_tokens': 0, 'seconds': 0.0}
+        logger.info("LLM model loaded from %s (speculative mode: %s)", model_path, speculative_mode)
+
+    def _record_speculative_stats(self, output, elapsed):
+        """
+        Updates and logs the acceptance rate and tokens/sec of speculative decoding.
+
+        Accepted tokens are counted exactly for every draft followed by another draft
+        call. The last draft is estimated from the completion length: the first token
+        comes from the prompt pass and each verification pass yields its accepted
+        tokens plus one, so the last pass accepted completion tokens - calls - earlier
+        accepted tokens - 1 (clamped at 0). When generation stops on EOS, usage leaves
+        out the EOS token, so this estimate may be one token low.
+
+        Parameters:
+            output (dict): The completion returned by llama_cpp.
+            elapsed (float): Wall-clock generation time in seconds.
+
+        Returns:
+            dict: Statistics for this call.
+        """
+        completion_tokens = output.get('usage', {}).get('completion_tokens', 0)
+        proposed = self.draft_model.proposed_tokens
+        accepted = self.draft_model.accepted_tokens
+        if self.draft_model.pending_draft is not None:
+            last_draft = self.draft_model.pending_draft[1]
+            last_accepted = completion_tokens - self.draft_model.calls - accepted - 1
+            accepted += min(max(last_accepted, 0), len(last_draft))
+        stats = {
+            'completion_tokens': completion_tokens,
+            'proposed_tokens': proposed,
+            'accepted_tokens': accepted,
+            'acceptance_rate': accepted / proposed if proposed else 0.0,
+            'tokens_per_sec': completion_tokens / elapsed if elapsed > 0 else 0.0,
+        }
+        self.speculative_stats['completion_tokens'] += completion_tokens
+        self.speculative_stats['proposed_tokens'] += proposed
+        self.speculative_stats['accepted_tokens'] += accepted
+        self.speculative_stats['seconds'] += elapsed
+        logger.info("Speculative decoding: acceptance rate %.2f (%s/%s), %.2f tokens/sec",
+                    stats['acceptance_rate'], accepted, proposed, stats['tokens_per_sec'])
+        return stats
+
+    def get_speculative_summary(self):
+        """
+        Returns the cumulative acceptance rate and tokens/sec over all calls.
+
+        Returns:
+            dict: Cumulative speculative decoding statistics.
+        """
+        totals = self.speculative_stats
+        return {
+            **totals,
+            'acceptance_rate': totals['accepted_tokens'] / totals['proposed_tokens'] if totals['proposed_tokens'] else 0.0,
+            'tokens_per_sec': totals['completion_tokens'] / totals['seconds'] if totals['seconds'] > 0 else 0.0,
+        }
 
     def get_response(self, prompt, max_tokens=32, temperature=0.0, top_p=0.0, seed=42):
         """
         Generates a response from the LLM based on the given prompt.
 
+        With speculative decoding enabled and temperature=0.0, drafted tokens are only
+        accepted when they match the main model's greedy choice, so the output is
+        greedy-equivalent up to batched-evaluation numerics: drafts are verified in
+        batched eval calls, whose logits can differ slightly from one-token-at-a-time
+        decoding and flip near-tied choices.
+
         Parameters:
             prompt (str): The input prompt/question.
             max_tokens (int): Maximum number of tokens to generate.
@@ -30,22 +186,37 @@ class LLMInterface:
             str: The generated response text.
         """
         try:
-            output = self.llm(
-                prompt,
-                max_tokens=max_tokens,
-                echo=False,
-                seed=seed,
-                temperature=temperature,
-                top_p=top_p
-            )
-            logging.info(f"LLM response for prompt '{prompt}': {output['choices']}")
+            n_prompt_tokens = len(self.llm.tokenize(prompt.encode('utf-8')))
+            if n_prompt_tokens >= self.llm.n_ctx():
+                logger.warning("Prompt of %s tokens does not fit the context window of %s tokens; "
+                               "increase n_ctx in ResourceConfig.", n_prompt_tokens, self.llm.n_ctx())
+                return ""
+            if n_prompt_tokens + max_tokens > self.llm.n_ctx():
+                # llama.cpp shrinks max_tokens to the remaining context
+                logger.warning("Prompt of %s tokens leaves only %s of %s new tokens in the context window of %s tokens.",
+                               n_prompt_tokens, self.llm.n_ctx() - n_prompt_tokens, max_tokens, self.llm.n_ctx())
+            if self.draft_model:
+                self.draft_model.reset()
+            start = time.perf_counter()
+            with track_engine(self.resources, ENGINE_LLAMA):
+                output = self.llm(
+                    prompt,
+                    max_tokens=max_tokens,
+                    echo=False,
+                    seed=seed,
+                    temperature=temperature,
+                    top_p=top_p
+                )
+            if self.draft_model:
+                self._record_speculative_stats(output, time.perf_counter() - start)
+            logger.debug("LLM response for prompt '%s': %s", prompt, output['choices'])
             if not output['choices']:
-                logging.warning("No output generated by the LLM.")
+                logger.warning("No output generated by the LLM.")
                 return ""
             llm_output_text = output['choices'][0]['text'].strip()
             if not llm_output_text:
-                logging.warning("LLM did not generate any response.")
+                logger.warning("LLM did not generate any response.")
             return llm_output_text
         except Exception as e:
-            logging.error(f"Error getting response from LLM: {e}")
+            logger.error("Error getting response from LLM: %s", e)
             return ""
\ No newline at end of file
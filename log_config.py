@@ -0,0 +1,88 @@
+# log_config.py
+import json
+import queue
+import atexit
+import logging
+import logging.handlers
+
+LOG_FORMAT = '%(asctime)s:%(levelname)s:%(name)s:%(message)s'
+
+class DebugSampler(logging.Filter):
+    def __init__(self, sample_every=1):
+        """
+        Keeps one out of every `sample_every` DEBUG records; other levels always pass.
+
+        Parameters:
+            sample_every (int): Sampling interval for DEBUG records.
+        """
+        super().__init__()
+        self.sample_every = max(1, sample_every)
+        self.count = 0
+
+    def filter(self, record):
+        if record.levelno != logging.DEBUG or self.sample_every == 1:
+            return True
+        self.count += 1
+        return self.count % self.sample_every == 1
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Formats records as compact JSON lines for machine-readable traces.
+    """
+    def format(self, record):
+        entry = {
+            't': round(record.created, 6),
+            'level': record.levelname,
+            'logger': record.name,
+            'msg': record.getMessage(),
+        }
+        return json.dumps(entry, default=str, separators=(',', ':'))
+
+def setup_logging(log_file='main.log', level=logging.INFO, module_levels=None, debug_sample_every=1, trace_file=None):
+    """
+    Configures logging with a background writer thread. Records that pass the
+    level checks have their message merged on the calling thread, so mutable
+    arguments are captured as they were at the call, and are written to disk
+    by a QueueListener.
+
+    Parameters:
+        log_file (str): Path of the text log file, overwritten each run; None to disable.
+        level (int): Root logging level.
+        module_levels (dict): Per-module levels, e.g. {'entity_extractor': logging.WARNING}.
+        debug_sample_every (int): Keep one out of every N DEBUG records.
+        trace_file (str): Optional path of a JSONL trace file.
+
+    Returns:
+        callable: Function that flushes and stops the listener; also called automatically at exit.
+    """
+    handlers = []
+    if log_file:
+        file_handler = logging.FileHandler(log_file, mode='w')
+        file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handlers.append(file_handler)
+    if trace_file:
+        trace_handler = logging.FileHandler(trace_file, mode='w')
+        trace_handler.setFormatter(JsonLinesFormatter())
+        handlers.append(trace_handler)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.addFilter(DebugSampler(debug_sample_every))
+
+    root = logging.getLogger()
+    for handler in root.handlers[:]:
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
+    root.setLevel(level)
+    for module, module_level in (module_levels or {}).items():
+        logging.getLogger(module).setLevel(module_level)
+
+    listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+    def stop():
+        atexit.unregister(stop)
+        listener.stop()
+
+    atexit.register(stop)
+    return stop
\ No newline at end of file
@@ -2,20 +2,21 @@
 import sys
 import logging
 
+from resources import ResourceConfig
+
+# Thread budget must be applied before NumPy/spaCy/torch are imported
+resource_config = ResourceConfig()
+resource_config.apply_blas_env()
+
 from llm import LLMInterface
 from entity_extractor import EntityExtractor
 from answer_extractor import AnswerExtractor, ANSWER_TYPE_YES_NO, ANSWER_TYPE_ENTITY
 from fact_checker import FactChecker
-
-# Configure logging once in main.py
-logging.basicConfig(
-    filename='main.log',
-    level=logging.INFO,
-    format='%(asctime)s:%(levelname)s:%(name)s:%(message)s',
-    filemode='w'  # Overwrite log file each run; remove or change as needed
-)
+from log_config import setup_logging
 
 logger = logging.getLogger(__name__)
+# End-of-run tuning reports, kept at INFO even in quiet mode
+report_logger = logging.getLogger('report')
 
 def convert_dbpedia_to_wikipedia(uri):
     """
@@ -47,13 +48,13 @@ def process_question(question_id, question_text, llm_interface, entity_extractor
     Returns:
         dict: A dictionary containing the results for the question.
     """
-    logger.info(f"Processing question ID: {question_id}, Text: {question_text}")
+    logger.info("Processing question ID: %s, Text: %s", question_id, question_text)
 
     # Generate LLM response
     prompt = f"{question_text} Answer:"
     llm_output = llm_interface.get_response(prompt)
     if not llm_output:
-        logger.warning(f"No LLM output for question ID: {question_id}")
+        logger.warning("No LLM output for question ID: %s", question_id)
         return None
 
     # Combine question and LLM output for context
@@ -74,11 +75,11 @@ def process_question(question_id, question_text, llm_interface, entity_extractor
 
     # Extract answer and its type
     extracted_answer, answer_type = answer_extractor.extract_answer(llm_output, question_text)
-    logger.info(f"Extracted answer: {extracted_answer}, Type: {answer_type}")
+    logger.info("Extracted answer: %s, Type: %s", extracted_answer, answer_type)
 
     # Check correctness of the answer
     correctness = fact_checker.check_correctness(question_text, extracted_answer, answer_type)
-    logger.info(f"Answer correctness: {correctness}")
+    logger.info("Answer correctness: %s", correctness)
 
     # Build result dictionary
     result = {
@@ -94,31 +95,45 @@ def main():
     """
     Main function to execute the workflow.
     """
-    if len(sys.argv) != 2:
-        print("Usage: python main.py inputfile")
+    if len(sys.argv) not in (2, 3) or (len(sys.argv) == 3 and sys.argv[2] != '--quiet'):
+        print("Usage: python main.py inputfile [--quiet]")
         sys.exit(1)
 
     input_filename = sys.argv[1]
     output_filename = 'output.txt'
+    quiet = len(sys.argv) == 3  # Skip echoing results to the console
+
+    # Configure logging once in main.py; records are written by a background thread
+    setup_logging(
+        log_file='main.log',  # Overwritten each run
+        level=logging.WARNING if quiet else logging.INFO,
+        module_levels={'report': logging.INFO},  # e.g. add 'entity_extractor': logging.DEBUG
+        debug_sample_every=1,  # Keep one out of every N DEBUG records
+        trace_file=None  # e.g. 'trace.jsonl' for a structured JSONL trace
+    )
 
     logger.info("Program started.")
+    logger.info("Resource configuration: %s CPUs, threads per engine: %s", resource_config.cpus, resource_config.threads)
 
     # Initialize modules
     model_path = "../models/llama-2-7b.Q4_K_M.gguf"  # Update the path as necessary
+    speculative_mode = None  # None, "prompt_lookup" or "draft_model"
+    draft_model_path = None  # Small GGUF sharing the llama-2 vocabulary, used with "draft_model"
     try:
-        llm_interface = LLMInterface(model_path=model_path)
+        llm_interface = LLMInterface(model_path=model_path, speculative_mode=speculative_mode, draft_model_path=draft_model_path,
+                                     resources=resource_config)
     except Exception as e:
-        logger.error(f"Failed to initialize LLMInterface: {e}")
+        logger.error("Failed to initialize LLMInterface: %s", e)
         sys.exit(1)
 
     try:
-        entity_extractor = EntityExtractor()
+        entity_extractor = EntityExtractor(resources=resource_config)
     except Exception as e:
-        logger.error(f"Failed to initialize EntityExtractor: {e}")
+        logger.error("Failed to initialize EntityExtractor: %s", e)
         sys.exit(1)
 
-    answer_extractor = AnswerExtractor()
-    fact_checker = FactChecker()
+    answer_extractor = AnswerExtractor(resources=resource_config)
+    fact_checker = FactChecker(resources=resource_config)
 
     try:
         with open(input_filename, 'r') as infile, open(output_filename, 'w') as outfile:
@@ -129,7 +144,7 @@ def main():
                 # Each line is in the format: <ID><TAB>text of the question>
                 parts = line.split('\t')
                 if len(parts) != 2:
-                    logger.warning(f"Invalid input line format: {line}")
+                    logger.warning("Invalid input line format: %s", line)
                     continue
                 question_id, question_text = parts
                 result = process_question(question_id, question_text, llm_interface, entity_extractor, answer_extractor, fact_checker)
@@ -150,6 +165,8 @@ def main():
 
 
                 # Optionally, print to console as per the original code
+                if quiet:
+                    continue
                 print(f"{question_id}\tR\"{result['llm_output']}\"\n")
                 for entity, uri in result['entities']:
                     wikipedia_uri = convert_dbpedia_to_wikipedia(uri)
@@ -158,12 +175,17 @@ def main():
                 print(f"{question_id}\tC\"{result['correctness']}\"\n")
 
     except FileNotFoundError:
-        logger.error(f"Input file '{input_filename}' not found.")
+        logger.error("Input file '%s' not found.", input_filename)
         sys.exit(1)
     except Exception as e:
-        logger.error(f"An unexpected error occurred: {e}")
+        logger.error("An unexpected error occurred: %s", e)
         sys.exit(1)
 
+    if speculative_mode:
+        report_logger.info("Speculative decoding summary: %s", llm_interface.get_speculative_summary())
+
+    report_logger.info("Engine utilization report: %s", resource_config.utilization_report())
+
     logger.info("Program finished.")
 
 if __name__ == "__main__":
@@ -0,0 +1,175 @@
+# resources.py
+import os
+import time
+import logging
+from contextlib import contextmanager, nullcontext
+
+logger = logging.getLogger(__name__)
+
+BLAS_ENV_VARS = ('OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS',
+                 'VECLIB_MAXIMUM_THREADS', 'NUMEXPR_NUM_THREADS')
+
+ENGINE_LLAMA = 'llama'
+ENGINE_TORCH = 'torch'
+ENGINE_SPACY = 'spacy'
+
+def read_cgroup_cpu_limit():
+    """
+    Reads the CPU quota of the current cgroup (v2 or v1).
+
+    Returns:
+        float or None: The number of CPUs allowed by the quota, or None if unlimited.
+    """
+    try:
+        with open('/sys/fs/cgroup/cpu.max') as f:
+            quota, period = f.read().split()
+            if quota != 'max':
+                return int(quota) / int(period)
+            return None
+    except (OSError, ValueError):
+        pass
+    try:
+        with open('/sys/fs/cgroup/cpu/cpu.cfs_quota_us') as f:
+            quota = int(f.read())
+        with open('/sys/fs/cgroup/cpu/cpu.cfs_period_us') as f:
+            period = int(f.read())
+        if quota > 0 and period > 0:
+            return quota / period
+    except (OSError, ValueError):
+        pass
+    return None
+
+def detect_available_cpus():
+    """
+    Detects the number of CPUs this process may use, honouring CPU affinity
+    and the cgroup CPU quota.
+
+    Returns:
+        int: The number of usable CPUs (at least 1).
+    """
+    try:
+        cpus = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cpus = os.cpu_count() or 1
+    quota = read_cgroup_cpu_limit()
+    if quota is not None:
+        cpus = min(cpus, max(1, int(quota)))
+    return max(1, cpus)
+
+def track_engine(resources, engine):
+    """
+    Returns a context manager that tracks time spent in an engine, or a no-op
+    context manager when no resource configuration is given.
+
+    Parameters:
+        resources (ResourceConfig): The resource configuration, or None.
+        engine (str): The engine name ('llama', 'torch' or 'spacy').
+    """
+    return resources.track(engine) if resources else nullcontext()
+
+class ResourceConfig:
+    def __init__(self, cpus=None, workers=1, n_ctx=256, use_mmap=True, use_mlock=False, blas_threads=1):
+        """
+        Central CPU thread and memory budget for llama.cpp, torch and spaCy/NumPy.
+
+        The pipeline stages run one after another, so each engine gets the full
+        per-worker budget while BLAS stays single threaded to avoid oversubscribing
+        cores next to the llama.cpp and torch pools.
+
+        Parameters:
+            cpus (int): Number of CPUs to budget; detected when None.
+            workers (int): Number of pipelines running in parallel that share the CPUs.
+            n_ctx (int): llama.cpp context size; short prompts plus 32 generated tokens fit in 256.
+                LLMInterface skips prompts that fill the whole window and otherwise lets
+                llama.cpp shrink max_tokens to fit, logging a warning in both cases.
+            use_mmap (bool): Memory-map the GGUF model instead of reading it into memory.
+            use_mlock (bool): Lock the model pages in RAM to prevent swapping.
+            blas_threads (int): Threads for BLAS/OpenMP used by NumPy and spaCy.
+        """
+        self.cpus = cpus or detect_available_cpus()
+        self.workers = max(1, workers)
+        threads_per_worker = max(1, self.cpus // self.workers)
+        self.threads = {
+            ENGINE_LLAMA: threads_per_worker,
+            ENGINE_TORCH: threads_per_worker,
+            ENGINE_SPACY: max(1, min(blas_threads, threads_per_worker)),
+        }
+        self.n_ctx = n_ctx
+        self.use_mmap = use_mmap
+        self.use_mlock = use_mlock
+        self.usage = {engine: {'calls': 0, 'wall_seconds': 0.0, 'cpu_seconds': 0.0} for engine in self.threads}
+
+    def apply_blas_env(self):
+        """
+        Sets the BLAS/OpenMP thread environment variables. Must be called before
+        NumPy, spaCy or torch are imported to take effect. Variables already set
+        by the user are left untouched.
+        """
+        for var in BLAS_ENV_VARS:
+            os.environ.setdefault(var, str(self.threads[ENGINE_SPACY]))
+
+    def configure_torch(self):
+        """
+        Sets the torch intra-op and inter-op thread pools.
+        """
+        import torch
+        torch.set_num_threads(self.threads[ENGINE_TORCH])
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Only allowed once, before any inter-op parallel work has started
+            logger.debug("torch inter-op threads already initialized.")
+        logger.info("torch configured with %s threads.", self.threads[ENGINE_TORCH])
+
+    def llama_kwargs(self):
+        """
+        Returns the threading and memory options for llama_cpp.Llama.
+
+        Returns:
+            dict: Keyword arguments for llama_cpp.Llama.
+        """
+        return {
+            'n_threads': self.threads[ENGINE_LLAMA],
+            'n_threads_batch': self.threads[ENGINE_LLAMA],
+            'n_ctx': self.n_ctx,
+            'use_mmap': self.use_mmap,
+            'use_mlock': self.use_mlock,
+        }
+
+    @contextmanager
+    def track(self, engine):
+        """
+        Context manager that records wall-clock and process CPU time spent in an engine.
+
+        Parameters:
+            engine (str): The engine name ('llama', 'torch' or 'spacy').
+        """
+        wall_start, cpu_start = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            usage = self.usage[engine]
+            usage['calls'] += 1
+            usage['wall_seconds'] += time.perf_counter() - wall_start
+            usage['cpu_seconds'] += time.process_time() - cpu_start
+
+    def utilization_report(self):
+        """
+        Builds a per-engine report of assigned threads and CPU utilization.
+        Utilization is CPU time divided by wall time times the assigned threads.
+        CPU time comes from time.process_time(), which covers the whole process,
+        including the background log writer thread.
+
+        Returns:
+            dict: Per-engine statistics.
+        """
+        report = {}
+        for engine, usage in self.usage.items():
+            threads = self.threads[engine]
+            wall = usage['wall_seconds']
+            report[engine] = {
+                **usage,
+                'threads': threads,
+                'utilization': usage['cpu_seconds'] / (wall * threads) if wall > 0 else 0.0,
+            }
+        return report
\ No newline at end of file